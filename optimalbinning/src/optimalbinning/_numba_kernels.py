@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+
+'''
+Optional Numba-compiled counting kernels.
+
+Importing this module requires Numba.  Callers guard the import and fall
+back to the NumPy implementations when Numba is not installed.
+
+Copyright (c) 2024 Ming-Long Lam, Ph.D., Chicago, Illinois, USA. All rights reserved.
+'''
+
+import numba
+import numpy
+
+@numba.njit(cache = True, fastmath = True, parallel = True)
+def _bin_count_uniform (data, low_x, bin_width, n_bin):
+
+    '''Count the observations per bin for uniformly spaced boundaries.
+    The bins are left-closed, right-opened intervals; the first and the last
+    bins are open-ended.
+
+    Parameters
+    ----------
+    data : (float64[:]) the array of non-missing data values
+    low_x : (float) the lower boundary of the second bin
+    bin_width : (float) the common width of the bins
+    n_bin : (int) the number of bins
+
+    Returns
+    -------
+    counts : (int64[:]) the number of observations per bin, size is n_bin.
+    '''
+
+    inv_w = 1.0 / bin_width
+
+    # Per-thread count buffers, reduced at the end, avoid atomic updates
+    n_thread = numba.get_num_threads()
+    local_counts = numpy.zeros((n_thread, n_bin), dtype = numpy.int64)
+
+    for i in numba.prange(data.shape[0]):
+        k = int(numpy.floor((data[i] - low_x) * inv_w)) + 1
+        if (k < 0):
+            k = 0
+        elif (k >= n_bin):
+            k = n_bin - 1
+        local_counts[numba.get_thread_id(), k] += 1
+
+    counts = numpy.zeros(n_bin, dtype = numpy.int64)
+    for t in range(n_thread):
+        for k in range(n_bin):
+            counts[k] += local_counts[t, k]
+
+    return (counts)
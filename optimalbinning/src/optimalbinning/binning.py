@@ -1,301 +1,523 @@
-# -*- coding: utf-8 -*-
-
-'''
-Copyright (c) 2024 Ming-Long Lam, Ph.D., Chicago, Illinois, USA. All rights reserved.
-'''
-
-import math
-import numpy
-import pandas
-
-class Binning:
-    '''Base class of binning.
-
-    Members
-    -------
-    bin_width_candidate : (array) a list of bin width values considered.
-
-    list_criterion : (list) a list of the criterion values (ordered according to bin_width_candidate).
-    list_n_bin : (list) a list of the number of bins (ordered according to bin_width_candidate).
-    list_bin_boundary : (list) a list of the bin boundaries dataframe (ordered according to bin_width_candidate).
-
-    max_n_bin : (int) the maximum number of bins, must be greater than min_n_bin.
-    min_n_bin : (int) the minimum number of bins, must be smaller than max_n_bin.
-
-    optimal_criterion : (float) the lowest criterion value.
-    optimal_position : (int) the position in the lists corresponding to the lowest criterion value.
-    '''
-
-    bin_width_candidate = []
-
-    list_criterion = []
-    list_n_bin = []
-    list_bin_boundary = []
-
-    max_n_bin = None
-    min_n_bin = None
-
-    optimal_criterion = numpy.PINF
-    optimal_position = None
-
-    def bin_frequency (self, data = None, bin_lower_boundary = None):
-
-        '''Calculate the frequency (i.e., number of observations) given the bins.
-        The bins are left-closed, right-opened intervals
-
-        Parameters
-        ----------
-        x : (float) the array of non-missing data values
-        bin_lower_boundary : (float) the array of bin lower boundaries
-
-        Returns
-        -------
-        bin_details : (dataframe) An array of bin details, size is (n_bin, 3).  The columns are:
-            (0) 'LOWER_CLOSE' : lower-close limits
-            (1) 'UPPER_OPEN' : upper-open limits
-            (2) 'FREQUENCY' : the number of observations
-        '''
-
-        n_bin = len(bin_lower_boundary)
-
-        bin_upper_boundary = numpy.zeros(n_bin)
-        bin_upper_boundary[-1] = numpy.PINF
-
-        bin_frequency = numpy.zeros(n_bin)
-
-        if (n_bin >= 2):
-            bin_upper_boundary[0:-1] = bin_lower_boundary[1:]
-
-            for u in data:
-                qFound = False
-                for i in range(n_bin-1):
-                    if (u < bin_lower_boundary[i+1]):
-                        qFound = True
-                        bin_frequency[i] = bin_frequency[i] + 1.0
-                        break
-                if (not qFound):
-                    bin_frequency[n_bin-1] = bin_frequency[n_bin-1] + 1.0
-
-        elif (n_bin == 1):
-            bin_frequency[0] = numpy.len(data)
-
-        bin_details = pandas.DataFrame({'LOWER_CLOSE': bin_lower_boundary, \
-                                        'UPPER_OPEN': bin_upper_boundary, \
-                                        'FREQUENCY': bin_frequency})
-
-        return (bin_details)
-
-    def optimal_binning (self, data = None, min_n_bin = None, max_n_bin = None):
-        '''Determine the optimal binning definition.
-
-        Parameters
-        ----------
-        x : (float) the array of values, cannot contain any missing values
-        min_n_bin : (integer) the minimum number of bins. If min_n_bin is not None, it must be smaller than max_n_bin
-        max_n_bin : (integer) the maximum number of bins. If max_n_bin is not None, it must be greater than min_n_bin
-
-        Returns
-        -------
-        n_candidates : (int) number of bin width candidates considered.
-
-        Reference
-        ---------
-        Hideaki Shimazaki and Shigeru Shinomoto (2007).
-            A Method for Selecting the Bin Size of a Time Histogram,
-            Neural Computation, volume 19, issue 6, pages 1503-1527.
-            https://www.neuralengine.org/res/histogram.html
-        '''
-
-        n_candidates = 0
-
-        # Calculate number of values, minimum, maximum, range, and mean of x
-        _n_x = 0.0
-        _min_x = numpy.PINF
-        _max_x = numpy.NINF
-        _mean_x = 0.0
-
-        for u in data:
-            _n_x = _n_x + 1.0
-            _mean_x = _mean_x + u
-            if (u > _max_x):
-                _max_x = u
-            if (u < _min_x):
-                _min_x = u
-
-        if (_n_x > 0.0):
-            _mean_x = _mean_x / _n_x
-            _range_x = _max_x - _min_x
-        else:
-            raise ValueError('(optimal_binning): The input data array is empty')
-
-        # Specify default values
-        if (min_n_bin is None):
-            self.min_n_bin = 2
-        else:
-            self.min_n_bin = min_n_bin
-
-        if (max_n_bin is None):
-            self.max_n_bin = _n_x // 2
-        else:
-            self.max_n_bin = max_n_bin
-
-        if (self.max_n_bin < self.min_n_bin):
-            u = self.max_n_bin
-            self.max_n_bin = self.min_n_bin
-            self.max_n_bin = u
-
-        if (_range_x > 0.0):
-
-            # Determine the minimum and the maximum bin widths
-            min_bin_width = math.pow(10.0, math.floor(math.log10(_range_x / self.max_n_bin)))
-            max_bin_width = math.pow(10.0, math.ceil(math.log10(_range_x / self.min_n_bin)))
-
-            self.bin_width_candidate = []
-
-            self.list_criterion = []
-            self.list_n_bin = []
-            self.list_bin_boundary = []
-
-            sequence = 0
-            bin_width = min_bin_width
-            while (bin_width <= max_bin_width):
-
-                # Generate the boundaries that are nice numbers
-                middle_x = bin_width * numpy.round(_mean_x / bin_width)
-                n_bin_left = math.ceil((middle_x - _min_x) / bin_width)
-                n_bin_right = math.ceil((_max_x - middle_x) / bin_width)
-                n_bin = n_bin_left + n_bin_right
-
-                # Ensure the number of bins are within the specified limits
-                if (self.min_n_bin <= n_bin <= self.max_n_bin):
-                    low_x = middle_x - (n_bin_left - 1) * bin_width
-
-                    bin_lower_boundary = numpy.zeros(n_bin)
-                    bin_lower_boundary[0] = numpy.NINF
-
-                    if (n_bin > 2):
-                        bin_lower_boundary[1:] = low_x + bin_width * numpy.arange(0, n_bin-1, 1)
-                    elif (n_bin == 2):
-                        bin_lower_boundary[1] = low_x
-
-                    bin_details = self.bin_frequency(data = data, bin_lower_boundary = bin_lower_boundary)
-
-                    # Compute the Shimazaki and Shinomoto (2007) criterion
-                    mean_bin_freq = _n_x / n_bin
-                    var_bin_freq = numpy.sum(numpy.power((bin_details['FREQUENCY'].to_numpy() - mean_bin_freq), 2)) / n_bin
-                    criterion = (2.0 * mean_bin_freq - var_bin_freq) / bin_width / bin_width
-
-                    n_candidates += 1
-                    self.bin_width_candidate.append(bin_width)
-                    self.list_criterion.append(criterion)
-                    self.list_n_bin.append(n_bin)
-                    self.list_bin_boundary.append(bin_details)
-
-                    del bin_details
-
-                # Next bin_width values are multiples of 1, 2, 2.5, and 5
-                if (sequence == 1):
-                    bin_width = 1.25 * bin_width
-                else:
-                    bin_width = 2.0 * bin_width
-
-                # Increment sequence by 1 modulus 4
-                sequence = sequence + 1
-                if (sequence == 4):
-                    sequence = 0
-
-            lowest_criterion = numpy.PINF
-            lowest_position = None
-
-            i = -1
-            for v in self.list_criterion:
-                i += 1
-                if (v < lowest_criterion):
-                    lowest_criterion = v
-                    lowest_position = i
-
-            if (lowest_position is not None):
-                self.optimal_criterion = lowest_criterion
-                self.optimal_position = lowest_position
-        else:
-            raise ValueError('(optimal_binning): The minimum value equals the maximum value.  Binning cannot be done.')
-
-        return (n_candidates)
-
-    def get_binning_criterion (self):
-        '''Return the binning candidates and criteria.
-
-        Parameters
-        ----------
-        None
-
-        Returns
-        -------
-        binning_df: (DataFrame) the binning candidates and criteria.
-            'BIN_WIDTH': bin width candidates, 'CRITERION': bin criterion,
-            'N_BIN': number of bins.
-        '''
-
-        output_df = pandas.DataFrame({'BIN_WIDTH': self.bin_width_candidate, \
-                                      'CRITERION': self.list_criterion, \
-                                      'N_BIN': self.list_n_bin})
-
-        return (output_df.sort_values(by = 'BIN_WIDTH'))
-
-    def get_optimal_boundary (self):
-        '''Return the boundaries corresponding to the most optimal binning definition.
-
-        Parameters
-        ----------
-        None
-
-        Returns
-        -------
-        optimal_boundary: (DataFrame) the bin boundaries corresponding to the most optimal binning definition.
-            'LOWER_CLOSE': bin_lower_boundary, 'UPPER_OPEN': bin_upper_boundary, and 'FREQUENCY': bin_frequency.
-        '''
-
-        if (self.optimal_position is not None):
-            optimal_boundary = self.list_bin_boundary[self.optimal_position]
-        else:
-            optimal_boundary = None
-
-        return (optimal_boundary)
-
-    def get_optimal_nbin (self):
-        '''Return the number of bins corresponding to the most optimal binning definition.
-
-        Parameters
-        ----------
-        None
-
-        Returns
-        -------
-        optimal_nbin: (float) the number of bins corresponding to the most optimal binning definition.
-        '''
-
-        if (self.optimal_position is not None):
-            optimal_nbin = self.list_n_bin[self.optimal_position]
-        else:
-            optimal_nbin = 0
-
-        return (optimal_nbin)
-
-    def get_optimal_width (self):
-        '''Return the width corresponding to the most optimal binning definition.
-
-        Parameters
-        ----------
-        None
-
-        Returns
-        -------
-        optimal_width: (float) the width corresponding to the most optimal binning definition.
-        '''
-
-        if (self.optimal_position is not None):
-            optimal_width = self.bin_width_candidate[self.optimal_position]
-        else:
-            optimal_width = None
-
-        return (optimal_width)
+# -*- coding: utf-8 -*-
+
+'''
+Copyright (c) 2024 Ming-Long Lam, Ph.D., Chicago, Illinois, USA. All rights reserved.
+'''
+
+import concurrent.futures
+import math
+import numpy
+import pandas
+
+try:
+    from ._numba_kernels import _bin_count_uniform
+except ImportError:
+    _bin_count_uniform = None
+
+try:
+    from ._binning_ext import eval_width as _eval_width_ext
+except ImportError:
+    _eval_width_ext = None
+
+# Below this size the Numba dispatch overhead exceeds the NumPy path
+_NUMBA_MIN_SIZE = 10_000
+
+def _candidate_n_bin (bin_width, mean_x, min_x, max_x):
+
+    '''Determine the bin layout of one candidate width.
+
+    Parameters
+    ----------
+    bin_width : (float) the candidate bin width
+    mean_x, min_x, max_x : (float) the mean, minimum, and maximum data values
+
+    Returns
+    -------
+    (middle_x, n_bin_left, n_bin) : the middle boundary that is a nice number, the
+        number of bins to its left, and the total number of bins.
+    '''
+
+    # Generate the boundaries that are nice numbers.  The scalar round stays
+    # in Python; the numpy ufunc would pay dispatch overhead per candidate
+    middle_x = bin_width * round(mean_x / bin_width)
+    n_bin_left = int(math.ceil((middle_x - min_x) / bin_width))
+    n_bin_right = int(math.ceil((max_x - middle_x) / bin_width))
+
+    return (middle_x, n_bin_left, n_bin_left + n_bin_right)
+
+def _eval_width (bin_width, data_sorted, n_x, mean_x, min_x, max_x, min_n_bin, max_n_bin, \
+                 idx_template = None):
+
+    '''Evaluate one candidate bin width against the sorted data.
+
+    Parameters
+    ----------
+    bin_width : (float) the candidate bin width
+    data_sorted : (float) the sorted array of non-missing data values
+    n_x : (int) the number of data values
+    mean_x, min_x, max_x : (float) the mean, minimum, and maximum data values
+    min_n_bin, max_n_bin : (int) the limits on the number of bins
+    idx_template : (float) optional precomputed arange of at least max_n_bin - 1
+        values, shared across candidates to avoid an arange call per candidate
+
+    Returns
+    -------
+    None when the candidate yields a number of bins outside the limits, otherwise the tuple
+    (bin_width, n_bin, var_bin_freq, bin_lower_boundary, bin_upper_boundary, bin_frequency).
+    '''
+
+    middle_x, n_bin_left, n_bin = _candidate_n_bin(bin_width, mean_x, min_x, max_x)
+
+    # Ensure the number of bins are within the specified limits
+    if (not (min_n_bin <= n_bin <= max_n_bin)):
+        return (None)
+
+    low_x = middle_x - (n_bin_left - 1) * bin_width
+
+    bin_lower_boundary = numpy.zeros(n_bin)
+    bin_lower_boundary[0] = -numpy.inf
+
+    if (n_bin > 2):
+        if (idx_template is None):
+            idx_template = numpy.arange(0, n_bin-1, 1, dtype = numpy.float64)
+        bin_lower_boundary[1:] = low_x + bin_width * idx_template[:n_bin-1]
+    elif (n_bin == 2):
+        bin_lower_boundary[1] = low_x
+
+    if (_eval_width_ext is not None and data_sorted.dtype == numpy.float64):
+        # Compiled kernel: bin counting and count variance fused in one C pass
+        counts = numpy.empty(n_bin, dtype = numpy.int64)
+        var_bin_freq = _eval_width_ext(data_sorted, float(low_x), 1.0 / float(bin_width), \
+                                       n_bin, counts)
+        bin_frequency = counts.astype(float)
+    else:
+        # Each bin count is the difference of the sorted positions of its two
+        # boundaries, an O(B log N) lookup per candidate.  The edge dtype is
+        # matched to the data so the search compares at the working precision
+        # instead of upcasting the sorted array, and the differences go
+        # straight into the result array; no temporaries
+        edges = bin_lower_boundary[1:].astype(data_sorted.dtype, copy = False)
+        pos = numpy.searchsorted(data_sorted, edges, side = 'left')
+        bin_frequency = numpy.empty(n_bin)
+        bin_frequency[0] = pos[0]
+        bin_frequency[-1] = n_x - pos[-1]
+        numpy.subtract(pos[1:], pos[:-1], out = bin_frequency[1:-1])
+
+        # The criterion only needs the variance of the counts here; the counts
+        # sum to n_x, so their mean is exactly n_x / n_bin and the biased
+        # variance equals the second central moment in the criterion.  The
+        # candidate criteria are evaluated in one shot by the caller
+        var_bin_freq = bin_frequency.var()
+
+    bin_upper_boundary = numpy.zeros(n_bin)
+    bin_upper_boundary[-1] = numpy.inf
+    bin_upper_boundary[0:-1] = bin_lower_boundary[1:]
+
+    return (bin_width, n_bin, var_bin_freq, bin_lower_boundary, bin_upper_boundary, bin_frequency)
+
+class Binning:
+    '''Base class of binning.
+
+    Members
+    -------
+    bin_width_candidate : (array) a list of bin width values considered.
+
+    list_criterion : (list) a list of the criterion values (ordered according to bin_width_candidate).
+    list_n_bin : (list) a list of the number of bins (ordered according to bin_width_candidate).
+    list_bin_boundary : (list) a list of (bin_lower_boundary, bin_upper_boundary, bin_frequency)
+        array tuples (ordered according to bin_width_candidate).
+
+    max_n_bin : (int) the maximum number of bins, must be greater than min_n_bin.
+    min_n_bin : (int) the minimum number of bins, must be smaller than max_n_bin.
+
+    optimal_criterion : (float) the lowest criterion value.
+    optimal_position : (int) the position in the lists corresponding to the lowest criterion value.
+    '''
+
+    def __init__ (self):
+
+        self.bin_width_candidate = []
+
+        self.list_criterion = []
+        self.list_n_bin = []
+        self.list_bin_boundary = []
+
+        self.max_n_bin = None
+        self.min_n_bin = None
+
+        self.optimal_criterion = numpy.inf
+        self.optimal_position = None
+
+    def bin_frequency (self, data = None, bin_lower_boundary = None, uniform = None):
+
+        '''Calculate the frequency (i.e., number of observations) given the bins.
+        The bins are left-closed, right-opened intervals
+
+        Parameters
+        ----------
+        x : (float) the array of non-missing data values
+        bin_lower_boundary : (float) the array of bin lower boundaries
+        uniform : (tuple) optional (low_x, bin_width) pair.  When the inner boundaries
+            are uniformly spaced starting at low_x, the bin indices are computed by
+            arithmetic rescaling instead of a binary search per value
+
+        Returns
+        -------
+        bin_details : (dict) the bin details as three arrays of size n_bin.  The keys are:
+            (0) 'LOWER_CLOSE' : lower-close limits
+            (1) 'UPPER_OPEN' : upper-open limits
+            (2) 'FREQUENCY' : the number of observations
+            Pass the dict to pandas.DataFrame when a dataframe is wanted.
+        '''
+
+        n_bin = len(bin_lower_boundary)
+
+        data = numpy.asarray(data)
+
+        bin_upper_boundary = numpy.zeros(n_bin)
+        bin_upper_boundary[-1] = numpy.inf
+
+        bin_frequency = numpy.zeros(n_bin)
+
+        if (n_bin >= 2):
+            bin_upper_boundary[0:-1] = bin_lower_boundary[1:]
+
+            if (uniform is not None):
+                # Uniformly spaced boundaries: compute the bin index of each value
+                # directly by rescaling, avoiding the O(log B) lookup per value
+                low_x, bin_width = uniform
+
+                if (_bin_count_uniform is not None and data.shape[0] > _NUMBA_MIN_SIZE):
+                    counts = _bin_count_uniform(numpy.ascontiguousarray(data, dtype = numpy.float64), \
+                                                float(low_x), float(bin_width), n_bin)
+                    idx = None
+                else:
+                    idx = numpy.floor((data - low_x) * (1.0 / bin_width)).astype(numpy.intp) + 1
+                    numpy.clip(idx, 0, n_bin-1, out = idx)
+            else:
+                # Locate the bin of each value by a binary search on the inner boundaries.
+                # Values at or above the last boundary naturally map to the last bin.
+                edges = numpy.asarray(bin_lower_boundary[1:])
+                idx = numpy.searchsorted(edges, data, side = 'right')
+
+            if (idx is not None):
+                counts = numpy.bincount(idx, minlength = n_bin)
+
+            bin_frequency = counts.astype(float)
+
+        elif (n_bin == 1):
+            bin_frequency[0] = data.shape[0]
+
+        bin_details = {'LOWER_CLOSE': numpy.asarray(bin_lower_boundary), \
+                       'UPPER_OPEN': bin_upper_boundary, \
+                       'FREQUENCY': bin_frequency}
+
+        return (bin_details)
+
+    def optimal_binning (self, data = None, min_n_bin = None, max_n_bin = None):
+        '''Determine the optimal binning definition.
+
+        Parameters
+        ----------
+        x : (float) the array of values, cannot contain any missing values
+        min_n_bin : (integer) the minimum number of bins. If min_n_bin is not None, it must be smaller than max_n_bin
+        max_n_bin : (integer) the maximum number of bins. If max_n_bin is not None, it must be greater than min_n_bin
+
+        Returns
+        -------
+        n_candidates : (int) number of bin width candidates considered.
+
+        Reference
+        ---------
+        Hideaki Shimazaki and Shigeru Shinomoto (2007).
+            A Method for Selecting the Bin Size of a Time Histogram,
+            Neural Computation, volume 19, issue 6, pages 1503-1527.
+            https://www.neuralengine.org/res/histogram.html
+        '''
+
+        n_candidates = 0
+
+        # Keep float32 input at float32: the counting pass is bandwidth-bound,
+        # so upcasting would double the bytes moved for no benefit
+        data = numpy.asarray(data)
+        if (data.dtype not in (numpy.float32, numpy.float64)):
+            data = data.astype(numpy.float64)
+
+        if (data.size == 0):
+            raise ValueError('(optimal_binning): The input data array is empty')
+
+        # Calculate number of values, minimum, maximum, range, and mean of x.
+        # The summary scalars are held at float64 to keep the boundary and
+        # criterion arithmetic accurate regardless of the working dtype
+        _n_x = int(data.size)
+        _mean_x = float(data.mean(dtype = numpy.float64))
+        _min_x = float(data.min())
+        _max_x = float(data.max())
+        _range_x = _max_x - _min_x
+
+        # Specify default values
+        if (min_n_bin is None):
+            self.min_n_bin = 2
+        else:
+            self.min_n_bin = min_n_bin
+
+        if (max_n_bin is None):
+            self.max_n_bin = _n_x // 2
+        else:
+            self.max_n_bin = max_n_bin
+
+        if (self.max_n_bin < self.min_n_bin):
+            self.min_n_bin, self.max_n_bin = self.max_n_bin, self.min_n_bin
+
+        if (_range_x > 0.0):
+
+            # Sort once so that every candidate can be counted from the
+            # positions of its boundaries instead of a pass over the data
+            data_sorted = numpy.sort(data)
+
+            n_candidates = self._search_widths(data_sorted, _n_x, _mean_x, _min_x, _max_x)
+        else:
+            raise ValueError('(optimal_binning): The minimum value equals the maximum value.  Binning cannot be done.')
+
+        return (n_candidates)
+
+    def _search_widths (self, data_sorted, _n_x, _mean_x, _min_x, _max_x):
+        '''Run the candidate bin-width search against pre-sorted data.
+        The n_bin limits must already be set on the instance.
+
+        Parameters
+        ----------
+        data_sorted : (float) the sorted array of non-missing data values
+        _n_x : (int) the number of data values
+        _mean_x, _min_x, _max_x : (float) the mean, minimum, and maximum data values
+
+        Returns
+        -------
+        n_candidates : (int) number of bin width candidates considered.
+        '''
+
+        n_candidates = 0
+        _range_x = _max_x - _min_x
+
+        # Determine the minimum and the maximum bin widths
+        min_bin_width = math.pow(10.0, math.floor(math.log10(_range_x / self.max_n_bin)))
+        max_bin_width = math.pow(10.0, math.ceil(math.log10(_range_x / self.min_n_bin)))
+
+        self.bin_width_candidate = []
+
+        self.list_criterion = []
+        self.list_n_bin = []
+        self.list_bin_boundary = []
+
+        list_var_bin_freq = []
+
+        # Candidate bin widths are the nice numbers 1, 2, 2.5, and 5 times a
+        # power of ten; generate the whole schedule up front per decade
+        decades = numpy.arange(math.log10(min_bin_width), math.log10(max_bin_width) + 1.0)
+        widths = numpy.concatenate([math.pow(10.0, d) * numpy.array([1.0, 2.0, 2.5, 5.0]) \
+                                    for d in decades])
+        widths = widths[(widths >= min_bin_width) & (widths <= max_bin_width)]
+
+        # The number of bins is non-increasing in the bin width, so trim the
+        # schedule with scalar arithmetic before touching the data: skip the
+        # widths still too narrow, and stop at the first width too wide
+        trimmed_widths = []
+        largest_n_bin = 0
+        for bin_width in widths:
+            n_bin = _candidate_n_bin(bin_width, _mean_x, _min_x, _max_x)[2]
+            if (n_bin > self.max_n_bin):
+                continue
+            if (n_bin < self.min_n_bin):
+                break
+            trimmed_widths.append(bin_width)
+            largest_n_bin = max(largest_n_bin, n_bin)
+        widths = trimmed_widths
+
+        # One arange serves every candidate; each takes the slice it needs
+        idx_template = numpy.arange(largest_n_bin, dtype = numpy.float64)
+
+        # Each candidate width is independent given the sorted data, and the
+        # searchsorted kernel releases the GIL, so evaluate them on threads
+        with concurrent.futures.ThreadPoolExecutor() as executor:
+            results = list(executor.map(lambda w: _eval_width(w, data_sorted, _n_x, \
+                                                              _mean_x, _min_x, _max_x, \
+                                                              self.min_n_bin, self.max_n_bin, \
+                                                              idx_template = idx_template), \
+                                        widths))
+
+        for result in results:
+            if (result is None):
+                continue
+
+            bin_width, n_bin, var_bin_freq, bin_lower_boundary, bin_upper_boundary, bin_freq = result
+
+            n_candidates += 1
+            self.bin_width_candidate.append(bin_width)
+            list_var_bin_freq.append(var_bin_freq)
+            self.list_n_bin.append(n_bin)
+            self.list_bin_boundary.append((bin_lower_boundary, bin_upper_boundary, bin_freq))
+
+        # Compute the Shimazaki and Shinomoto (2007) criterion of all the
+        # accepted candidates in one vectorized pass
+        if (n_candidates > 0):
+            width_arr = numpy.asarray(self.bin_width_candidate)
+            mean_arr = _n_x / numpy.asarray(self.list_n_bin, dtype = numpy.float64)
+            var_arr = numpy.asarray(list_var_bin_freq)
+            criteria = (2.0 * mean_arr - var_arr) / (width_arr * width_arr)
+            self.list_criterion = criteria.tolist()
+
+        if (self.list_criterion):
+            criterion_arr = numpy.asarray(self.list_criterion)
+            self.optimal_position = int(criterion_arr.argmin())
+            self.optimal_criterion = float(criterion_arr[self.optimal_position])
+
+        return (n_candidates)
+
+    def optimal_binning_batch (self, data = None, axis = 0, min_n_bin = None, max_n_bin = None):
+        '''Determine the optimal binning definition of several data columns at once.
+        The columns share one sort call and one pass each for the summary
+        statistics, amortizing the per-call overhead of optimal_binning.
+
+        Parameters
+        ----------
+        data : (float) a two-dimensional array of values, cannot contain any missing values
+        axis : (integer) the axis along which the observations run; 0 means each
+            column is a dataset, 1 means each row is a dataset
+        min_n_bin : (integer) the minimum number of bins. If min_n_bin is not None, it must be smaller than max_n_bin
+        max_n_bin : (integer) the maximum number of bins. If max_n_bin is not None, it must be greater than min_n_bin
+
+        Returns
+        -------
+        list_binning : (list) one fitted Binning object per column, in column order.
+        '''
+
+        data = numpy.asarray(data)
+        if (data.dtype not in (numpy.float32, numpy.float64)):
+            data = data.astype(numpy.float64)
+
+        if (data.ndim != 2):
+            raise ValueError('(optimal_binning_batch): The input data array must be two-dimensional')
+
+        if (axis == 1):
+            data = data.T
+        elif (axis != 0):
+            raise ValueError('(optimal_binning_batch): The axis must be 0 or 1')
+
+        if (data.size == 0):
+            raise ValueError('(optimal_binning_batch): The input data array is empty')
+
+        _n_x = int(data.shape[0])
+
+        # One sort call and one reduction pass each cover every column
+        data_sorted = numpy.sort(data, axis = 0)
+        _mean_x = data.mean(axis = 0, dtype = numpy.float64)
+        _min_x = data_sorted[0, :]
+        _max_x = data_sorted[-1, :]
+
+        list_binning = []
+        for j in range(data.shape[1]):
+            if (not (_max_x[j] > _min_x[j])):
+                raise ValueError('(optimal_binning_batch): The minimum value equals the maximum value in column %d.  Binning cannot be done.' % j)
+
+            binning = Binning()
+
+            # Specify default values
+            if (min_n_bin is None):
+                binning.min_n_bin = 2
+            else:
+                binning.min_n_bin = min_n_bin
+
+            if (max_n_bin is None):
+                binning.max_n_bin = _n_x // 2
+            else:
+                binning.max_n_bin = max_n_bin
+
+            if (binning.max_n_bin < binning.min_n_bin):
+                binning.min_n_bin, binning.max_n_bin = binning.max_n_bin, binning.min_n_bin
+
+            binning._search_widths(numpy.ascontiguousarray(data_sorted[:, j]), _n_x, \
+                                   float(_mean_x[j]), float(_min_x[j]), float(_max_x[j]))
+            list_binning.append(binning)
+
+        return (list_binning)
+
+    def get_binning_criterion (self):
+        '''Return the binning candidates and criteria.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        binning_df: (DataFrame) the binning candidates and criteria.
+            'BIN_WIDTH': bin width candidates, 'CRITERION': bin criterion,
+            'N_BIN': number of bins.
+        '''
+
+        output_df = pandas.DataFrame({'BIN_WIDTH': self.bin_width_candidate, \
+                                      'CRITERION': self.list_criterion, \
+                                      'N_BIN': self.list_n_bin})
+
+        return (output_df.sort_values(by = 'BIN_WIDTH'))
+
+    def get_optimal_boundary (self):
+        '''Return the boundaries corresponding to the most optimal binning definition.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        optimal_boundary: (DataFrame) the bin boundaries corresponding to the most optimal binning definition.
+            'LOWER_CLOSE': bin_lower_boundary, 'UPPER_OPEN': bin_upper_boundary, and 'FREQUENCY': bin_frequency.
+        '''
+
+        if (self.optimal_position is not None):
+            bin_lower_boundary, bin_upper_boundary, bin_frequency = self.list_bin_boundary[self.optimal_position]
+            optimal_boundary = pandas.DataFrame({'LOWER_CLOSE': bin_lower_boundary, \
+                                                 'UPPER_OPEN': bin_upper_boundary, \
+                                                 'FREQUENCY': bin_frequency})
+        else:
+            optimal_boundary = None
+
+        return (optimal_boundary)
+
+    def get_optimal_nbin (self):
+        '''Return the number of bins corresponding to the most optimal binning definition.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        optimal_nbin: (float) the number of bins corresponding to the most optimal binning definition.
+        '''
+
+        if (self.optimal_position is not None):
+            optimal_nbin = self.list_n_bin[self.optimal_position]
+        else:
+            optimal_nbin = 0
+
+        return (optimal_nbin)
+
+    def get_optimal_width (self):
+        '''Return the width corresponding to the most optimal binning definition.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        optimal_width: (float) the width corresponding to the most optimal binning definition.
+        '''
+
+        if (self.optimal_position is not None):
+            optimal_width = self.bin_width_candidate[self.optimal_position]
+        else:
+            optimal_width = None
+
+        return (optimal_width)